@@ -1,14 +1,94 @@
 # gui.py
 # Implements the Tkinter GUI for the CPU Scheduler Simulator with a dark and modern look using sv-ttk.
 
+import bisect
+import functools
+import itertools
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-import random # For coloring Gantt chart bars
+import tkinter.font as tkfont
 import sv_ttk
 
 from process import Process
 import scheduler # Assuming scheduler.py is in the same directory
 
+
+@functools.lru_cache(maxsize=64)
+def _layout_gantt(gantt_chart):
+    """
+    Computes the horizontal layout of a Gantt chart for drawing.
+
+    Cached on the chart itself, so re-displaying a previously simulated
+    configuration skips merging, scaling and label placement.
+
+    Args:
+        gantt_chart (tuple): Gantt chart entries ((p_id, start, end), ...).
+
+    Returns:
+        tuple: (canvas_width, bars, time_labels) where bars holds one
+            (x0, x1, fill, outline, pid_text) tuple per segment (pid_text is
+            None when the bar is too narrow for it) and time_labels holds
+            (x, text) tuples.
+    """
+    # Merge back-to-back segments of the same process so each run is drawn as one bar
+    merged = []
+    for entry in gantt_chart:
+        if merged and merged[-1][0] == entry[0] and merged[-1][2] == entry[1]:
+            merged[-1] = (entry[0], merged[-1][1], entry[2])
+        else:
+            merged.append(entry)
+
+    # Define colors for processes (can add more if needed)
+    # Each process gets a fixed color indexed by its ID, so colors are stable across runs
+    colors = ["#80CBC4", "#A1887F", "#FFD54F", "#64B5F6", "#E64A19", "#4DB6AC", "#7986CB", "#D4E157", "#F4511E"] # More modern color palette
+
+    padding = 10
+    min_label_gap = 30 # Minimum horizontal distance between time labels
+
+    # Determine scale
+    max_time = merged[-1][2]
+    # Add some buffer to the max time for better visualization
+    canvas_width_target = max(1000, max_time * 20) # Adjust multiplier for desired density
+    scale_factor = canvas_width_target / max_time if max_time > 0 else 1
+
+    # Compute every bar width and left edge up front in one pass
+    bar_widths = [max(end_time - start_time, 0) * scale_factor for _, start_time, end_time in merged]
+    bar_lefts = list(itertools.accumulate(bar_widths, initial=padding))
+
+    bars = []
+    time_labels = []
+    last_label_x = None # x of the last time label placed, to skip overlapping ones
+
+    for (p_id, start_time, end_time), bar_width, current_x in zip(merged, bar_widths, bar_lefts):
+        if bar_width <= 0: continue # Skip zero-duration entries
+
+        # Assign color
+        if p_id != "Idle":
+            fill_color = colors[(p_id - 1) % len(colors)]
+            outline_color = "#222" # Darker outline
+            pid_text = f"P{p_id}"
+        else:
+            fill_color = "#555" # Darker grey for idle
+            outline_color = "#444"
+            pid_text = "Idle"
+
+        # Process ID text only fits inside bars that are wide enough
+        if bar_width <= 25: # Adjust for readability
+            pid_text = None
+        bars.append((current_x, current_x + bar_width, fill_color, outline_color, pid_text))
+
+        # Start time label below the bar, unless it would overlap the previous one.
+        # Dense charts would otherwise create one unreadable canvas item per segment.
+        if last_label_x is None or current_x - last_label_x >= min_label_gap:
+            time_labels.append((current_x, str(start_time)))
+            last_label_x = current_x
+
+    # Final end time label
+    time_labels.append((bar_lefts[-1], str(max_time)))
+
+    return canvas_width_target + 50, tuple(bars), tuple(time_labels)
+
+
 class SchedulerGUI:
     """
     Manages the Tkinter GUI for the CPU Scheduler Simulator with a dark theme using sv-ttk.
@@ -27,7 +107,11 @@ class SchedulerGUI:
         # --- Dark Theme Configuration using sv-ttk ---
         sv_ttk.set_theme("dark")
 
-        self.processes = []
+        # Gantt chart fonts, created once so Tk doesn't re-parse a font spec per canvas item
+        self._pid_font = tkfont.Font(family='Helvetica', size=10, weight='bold')
+        self._time_font = tkfont.Font(family='Helvetica', size=9)
+
+        self.processes = [] # Kept sorted by arrival time (ties in insertion order)
         self.process_id_counter = 1
         self.time_quantum = tk.IntVar(value=2) # Default time quantum for RR
 
@@ -87,11 +171,17 @@ class SchedulerGUI:
         sjf_button = ttk.Button(control_frame, text="SJF", command=lambda: self.run_simulation('sjf'))
         sjf_button.grid(row=0, column=3, padx=10, pady=5)
 
+        srpt_button = ttk.Button(control_frame, text="SRPT", command=lambda: self.run_simulation('srpt'))
+        srpt_button.grid(row=0, column=4, padx=10, pady=5)
+
+        hrrn_button = ttk.Button(control_frame, text="HRRN", command=lambda: self.run_simulation('hrrn'))
+        hrrn_button.grid(row=0, column=5, padx=10, pady=5)
+
         priority_button = ttk.Button(control_frame, text="Priority", command=lambda: self.run_simulation('priority'))
-        priority_button.grid(row=0, column=4, padx=10, pady=5)
+        priority_button.grid(row=0, column=6, padx=10, pady=5)
 
         rr_button = ttk.Button(control_frame, text="Round Robin", command=lambda: self.run_simulation('rr'))
-        rr_button.grid(row=0, column=5, padx=10, pady=5)
+        rr_button.grid(row=0, column=7, padx=10, pady=5)
 
         # --- Results Frame ---
         results_frame = ttk.Frame(main_frame, padding=(10, 8))
@@ -102,9 +192,13 @@ class SchedulerGUI:
         gantt_frame.pack(pady=(0, 10), fill="x")
         self.gantt_canvas = tk.Canvas(gantt_frame, bg='#333', height=120, scrollregion=(0, 0, 1000, 120), highlightthickness=0) # Dark background
         # Horizontal Scrollbar for Gantt Chart
-        gantt_scrollbar_x = ttk.Scrollbar(gantt_frame, orient=tk.HORIZONTAL, command=self.gantt_canvas.xview)
-        self.gantt_canvas.configure(xscrollcommand=gantt_scrollbar_x.set)
-        gantt_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self.gantt_scrollbar_x = ttk.Scrollbar(gantt_frame, orient=tk.HORIZONTAL, command=self.gantt_canvas.xview)
+        # Only the visible part of the chart is drawn, so redraw whenever the view moves or resizes
+        self._gantt_layout = None # Layout of the chart currently shown (see _layout_gantt)
+        self._gantt_drawn_range = None # Index ranges of the bars/labels currently on the canvas
+        self.gantt_canvas.configure(xscrollcommand=self._on_gantt_xscroll)
+        self.gantt_canvas.bind("<Configure>", lambda event: self._draw_visible_gantt())
+        self.gantt_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
         self.gantt_canvas.pack(fill="x", expand=True)
 
         # Metrics and Table Area (Combined in a PanedWindow for resizing)
@@ -143,20 +237,37 @@ class SchedulerGUI:
         results_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
         self.results_tree.pack(fill="both", expand=True)
 
+    def _parse_inputs(self):
+        """
+        Parses the process input fields in a single pass.
+
+        Returns:
+            tuple: (True, (arrival, burst, priority)) if every field holds an integer,
+                otherwise (False, None). An empty priority field defaults to 0.
+        """
+        try:
+            return True, (int(self.arrival_entry.get()),
+                          int(self.burst_entry.get()),
+                          int(self.priority_entry.get() or 0))
+        except ValueError:
+            return False, None
+
     def add_process(self):
         """Adds a process based on the input fields."""
-        try:
-            arrival = int(self.arrival_entry.get())
-            burst = int(self.burst_entry.get())
-            priority_str = self.priority_entry.get()
-            priority = int(priority_str) if priority_str else 0 # Default priority if empty
+        ok, values = self._parse_inputs()
+        if not ok:
+            messagebox.showerror("Input Error", "Please enter valid integer values for arrival time, burst time, and priority.")
+            return
 
-            if arrival < 0 or burst <= 0 or priority < 0:
-                messagebox.showerror("Input Error", "Arrival time and priority must be non-negative.\nBurst time must be positive.")
-                return
+        arrival, burst, priority = values
+        if arrival < 0 or burst <= 0 or priority < 0:
+            messagebox.showerror("Input Error", "Arrival time and priority must be non-negative.\nBurst time must be positive.")
+            return
 
+        try:
             process = Process(self.process_id_counter, arrival, burst, priority)
-            self.processes.append(process)
+            # Insert in arrival order so simulations never need to re-sort
+            bisect.insort(self.processes, process, key=lambda p: p.arrival_time)
             self.process_id_counter += 1
 
             # Add to the list view (Treeview)
@@ -169,8 +280,6 @@ class SchedulerGUI:
             self.priority_entry.insert(0, "0") # Reset default priority
             self.arrival_entry.focus() # Set focus back to arrival time
 
-        except ValueError:
-            messagebox.showerror("Input Error", "Please enter valid integer values for arrival time, burst time, and priority.")
         except Exception as e:
             messagebox.showerror("Error", f"An unexpected error occurred: {e}")
 
@@ -179,19 +288,19 @@ class SchedulerGUI:
         if messagebox.askyesno("Confirm Clear", "Are you sure you want to remove all processes?"):
             self.processes = []
             self.process_id_counter = 1
-            # Clear the input list treeview
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            # Clear the input list treeview in a single call
+            self.tree.delete(*self.tree.get_children())
             # Clear results as well
             self.clear_results()
 
     def clear_results(self):
         """Clears the results area (Gantt, metrics, table)."""
+        self._gantt_layout = None
+        self._gantt_drawn_range = None
         self.gantt_canvas.delete("all")
         self.gantt_canvas.configure(scrollregion=(0, 0, 1000, 120)) # Reset scroll region
         self.metrics_label.config(text="Run a simulation to see metrics.")
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.results_tree.delete(*self.results_tree.get_children())
 
 
     def run_simulation(self, algorithm_name):
@@ -204,28 +313,22 @@ class SchedulerGUI:
         self.clear_results()
 
         try:
-            gantt_chart = []
-            avg_waiting = 0.0
-            avg_turnaround = 0.0
-            completed_procs = []
-
-            if algorithm_name == 'fcfs':
-                gantt_chart, avg_waiting, avg_turnaround, completed_procs = scheduler.fcfs(self.processes)
-            elif algorithm_name == 'sjf':
-                gantt_chart, avg_waiting, avg_turnaround, completed_procs = scheduler.sjf(self.processes)
-            elif algorithm_name == 'priority':
-                gantt_chart, avg_waiting, avg_turnaround, completed_procs = scheduler.priority_scheduling(self.processes)
-            elif algorithm_name == 'rr':
+            quantum = None
+
+            if algorithm_name == 'rr':
+                # Read the Tk variable once; the local is reused for the metrics text below
                 try:
                     quantum = self.time_quantum.get()
                     if quantum <= 0:
                         messagebox.showerror("Input Error", "Time quantum for Round Robin must be a positive integer.")
                         return
-                    gantt_chart, avg_waiting, avg_turnaround, completed_procs = scheduler.round_robin(self.processes, quantum)
-                except ValueError:
+                except (ValueError, tk.TclError): # IntVar.get() raises TclError for non-numeric text
                     messagebox.showerror("Input Error", "Please enter a valid integer for the time quantum.")
                     return
 
+            # Memoized per workload; self.processes is already in arrival order
+            gantt_chart, avg_waiting, avg_turnaround, result_rows = scheduler.simulate(
+                algorithm_name, self.processes, quantum, presorted=True)
 
             # --- Display Results ---
             # Update Metrics Label
@@ -233,16 +336,12 @@ class SchedulerGUI:
                             f"Average Waiting Time: {avg_waiting:.2f}\n"
                             f"Average Turnaround Time: {avg_turnaround:.2f}")
             if algorithm_name == 'rr':
-                metrics_text += f"\nTime Quantum: {self.time_quantum.get()}"
+                metrics_text += f"\nTime Quantum: {quantum}"
             self.metrics_label.config(text=metrics_text)
 
             # Populate Results Table
-            for proc in completed_procs:
-                self.results_tree.insert("", tk.END, values=(
-                    proc.p_id, proc.arrival_time, proc.burst_time, proc.priority,
-                    proc.start_time, proc.completion_time,
-                    proc.waiting_time, proc.turnaround_time
-                ))
+            for row in result_rows:
+                self.results_tree.insert("", tk.END, values=row)
 
             # Draw Gantt Chart
             self.draw_gantt_chart(gantt_chart)
@@ -256,69 +355,69 @@ class SchedulerGUI:
     def draw_gantt_chart(self, gantt_chart):
         """Draws the Gantt chart on the canvas."""
         self.gantt_canvas.delete("all")
+        self._gantt_drawn_range = None
         if not gantt_chart:
+            self._gantt_layout = None
             return
 
-        # Define colors for processes (can add more if needed)
-        colors = ["#80CBC4", "#A1887F", "#FFD54F", "#64B5F6", "#E64A19", "#4DB6AC", "#7986CB", "#D4E157", "#F4511E"] # More modern color palette
-        process_colors = {}
-        color_index = 0
+        self._gantt_layout = _layout_gantt(tuple(gantt_chart))
+        canvas_width = self._gantt_layout[0]
+        self.gantt_canvas.configure(scrollregion=(0, 0, canvas_width, 150)) # Update scroll region
+        self._draw_visible_gantt()
+
+    def _on_gantt_xscroll(self, first, last):
+        """Keeps the scrollbar in sync and draws the newly visible part of the chart."""
+        self.gantt_scrollbar_x.set(first, last)
+        self._draw_visible_gantt()
+
+    def _draw_visible_gantt(self):
+        """
+        Draws only the Gantt bars and labels that intersect the visible viewport.
+
+        Long simulations can produce scroll regions far wider than the window,
+        so creating canvas items for every segment up front is wasted work.
+        """
+        if self._gantt_layout is None:
+            return
+        _, bars, time_labels = self._gantt_layout
 
         # Constants for drawing
         bar_height = 40
         y_pos = 40
-        padding = 10
         time_label_y = y_pos + bar_height + 15
         pid_label_y = y_pos + bar_height / 2
+        label_margin = 30 # Labels are centered on their x, so keep those just off-screen
+
+        # Visible x-range in canvas coordinates
+        view_x0 = self.gantt_canvas.canvasx(0)
+        view_x1 = self.gantt_canvas.canvasx(self.gantt_canvas.winfo_width())
+
+        # Bars and labels are ordered by x, so binary search for the visible slices
+        first_bar = bisect.bisect_right(bars, view_x0, key=lambda bar: bar[1])
+        last_bar = bisect.bisect_left(bars, view_x1, key=lambda bar: bar[0])
+        first_label = bisect.bisect_left(time_labels, view_x0 - label_margin, key=lambda label: label[0])
+        last_label = bisect.bisect_right(time_labels, view_x1 + label_margin, key=lambda label: label[0])
+
+        drawn_range = (first_bar, last_bar, first_label, last_label)
+        if drawn_range == self._gantt_drawn_range:
+            return # Same items already on the canvas
+        self._gantt_drawn_range = drawn_range
+        self.gantt_canvas.delete("all")
 
-        # Determine scale
-        max_time = gantt_chart[-1][2] if gantt_chart else 1
-        # Add some buffer to the max time for better visualization
-        canvas_width_target = max(1000, max_time * 20) # Adjust multiplier for desired density
-        self.gantt_canvas.configure(scrollregion=(0, 0, canvas_width_target + 50, 150)) # Update scroll region
-
-        scale_factor = canvas_width_target / max_time if max_time > 0 else 1
-
-        current_x = padding
-
-        for entry in gantt_chart:
-            p_id, start_time, end_time = entry
-            duration = end_time - start_time
-            if duration <= 0: continue # Skip zero-duration entries
-
-            bar_width = duration * scale_factor
-
-            # Assign color
-            if p_id != "Idle":
-                if p_id not in process_colors:
-                    process_colors[p_id] = colors[color_index % len(colors)]
-                    color_index += 1
-                fill_color = process_colors[p_id]
-                outline_color = "#222" # Darker outline
-                pid_text = f"P{p_id}"
-            else:
-                fill_color = "#555" # Darker grey for idle
-                outline_color = "#444"
-                pid_text = "Idle"
-
+        for x0, x1, fill_color, outline_color, pid_text in bars[first_bar:last_bar]:
             # Draw rectangle
             self.gantt_canvas.create_rectangle(
-                current_x, y_pos, current_x + bar_width, y_pos + bar_height,
+                x0, y_pos, x1, y_pos + bar_height,
                 fill=fill_color, outline=outline_color, width=1
             )
 
             # Draw Process ID text inside the bar (if space permits)
-            text_x = current_x + bar_width / 2
-            if bar_width > 25: # Adjust for readability
-                self.gantt_canvas.create_text(text_x, pid_label_y, text=pid_text, anchor=tk.CENTER, font=('Helvetica', 10, 'bold'), fill="#eee") # Light text
-
-            # Draw start time label below the bar
-            self.gantt_canvas.create_text(current_x, time_label_y, text=str(start_time), anchor=tk.CENTER, font=('Helvetica', 9), fill="#ccc")
-
-            current_x += bar_width
+            if pid_text:
+                self.gantt_canvas.create_text((x0 + x1) / 2, pid_label_y, text=pid_text, anchor=tk.CENTER, font=self._pid_font, fill="#eee") # Light text
 
-        # Draw final end time label
-        self.gantt_canvas.create_text(current_x, time_label_y, text=str(max_time), anchor=tk.CENTER, font=('Helvetica', 9), fill="#ccc")
+        # Draw time labels below the bars
+        for x, text in time_labels[first_label:last_label]:
+            self.gantt_canvas.create_text(x, time_label_y, text=text, anchor=tk.CENTER, font=self._time_font, fill="#ccc")
 
 if __name__ == "__main__":
     # Create the main application window
@@ -5,6 +5,11 @@ class Process:
     """
     Represents a process with its scheduling attributes.
     """
+    # Fixed attribute set: no per-instance __dict__, smaller objects and faster attribute access
+    __slots__ = ('p_id', 'arrival_time', 'burst_time', 'priority',
+                 'remaining_burst_time', 'start_time', 'completion_time',
+                 'waiting_time', 'turnaround_time')
+
     def __init__(self, p_id, arrival_time, burst_time, priority=0):
         """
         Initializes a Process object.
@@ -27,6 +32,15 @@ class Process:
         self.waiting_time = -1          # Time spent waiting in the ready queue
         self.turnaround_time = -1      # Time from arrival to completion
 
+    def clone(self):
+        """
+        Returns a fresh copy of this process for a new simulation run.
+
+        Only the input attributes are copied; all calculated attributes start
+        from their initial values. This is much cheaper than copy.deepcopy.
+        """
+        return Process(self.p_id, self.arrival_time, self.burst_time, self.priority)
+
     def calculate_metrics(self):
         """
         Calculates waiting time and turnaround time after completion time is set.
@@ -38,12 +52,8 @@ class Process:
             # Waiting time = Turnaround Time - Burst Time
             # This formula works for both non-preemptive and preemptive algorithms
             # when calculated *after* the process completes.
-            self.waiting_time = self.turnaround_time - self.burst_time
-            # Ensure waiting time isn't negative due to potential float inaccuracies or logic errors
-            if self.waiting_time < 0:
-                # This might happen if start_time logic in RR is slightly off, let's clamp it
-                # print(f"Warning: Negative waiting time calculated for P{self.p_id}. Clamping to 0.")
-                self.waiting_time = 0
+            # Clamped at 0 so float inaccuracies or logic errors never yield a negative wait.
+            self.waiting_time = max(self.turnaround_time - self.burst_time, 0)
 
         else:
             # Should not happen if calculation is called correctly after completion
@@ -1,16 +1,44 @@
 # scheduler.py
-# Implements the CPU scheduling algorithms: FCFS, SJF, Priority, Round Robin.
-
-import copy
-from collections import deque
+# Implements the CPU scheduling algorithms: FCFS, SJF, SRPT, HRRN, Priority, Round Robin.
+
+import functools
+import heapq
+import operator
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from process import Process # Assuming process.py is in the same directory
 
-def fcfs(processes):
+# Immutable per-process result returned by simulate()
+ProcessResult = namedtuple('ProcessResult', [
+    'p_id', 'arrival_time', 'burst_time', 'priority',
+    'start_time', 'completion_time', 'waiting_time', 'turnaround_time',
+])
+
+def _prepare(processes, presorted=False):
+    """
+    Returns fresh working copies of the processes ordered by arrival time.
+
+    Args:
+        processes (list): A list of Process objects.
+        presorted (bool): True if processes are already ordered by arrival time,
+            in which case the sort is skipped.
+
+    Returns:
+        list: Clones of the processes (see Process.clone), sorted by arrival time.
+    """
+    process_list = [p.clone() for p in processes]
+    if not presorted:
+        process_list.sort(key=lambda p: p.arrival_time)
+    return process_list
+
+def fcfs(processes, presorted=False):
     """
     First-Come, First-Served (FCFS) Scheduling Algorithm (Non-Preemptive).
 
     Args:
         processes (list): A list of Process objects.
+        presorted (bool): True if processes are already sorted by arrival time. Defaults to False.
 
     Returns:
         tuple: Contains:
@@ -19,29 +47,27 @@ def fcfs(processes):
             - float: Average turnaround time.
             - list: List of completed Process objects with calculated metrics.
     """
-    # Create a deep copy to avoid modifying the original list
-    process_queue = sorted(copy.deepcopy(processes), key=lambda p: p.arrival_time)
+    # Work on copies to avoid modifying the original list
+    process_queue = _prepare(processes, presorted)
     completed_processes = []
     gantt_chart = []
     current_time = 0
     total_waiting_time = 0
     total_turnaround_time = 0
 
-    while process_queue:
-        # Get the next process based on arrival time
-        proc = process_queue.pop(0)
+    # Processes run strictly in arrival order, so a single pass over the sorted list suffices
+    for proc in process_queue:
+        # A process starts once it has arrived and the previous one has finished:
+        # start[i] = max(arrival[i], completion[i-1])
+        execution_start = max(current_time, proc.arrival_time)
 
-        # If CPU is idle before process arrival, advance time
-        if current_time < proc.arrival_time:
-            gantt_chart.append(("Idle", current_time, proc.arrival_time))
-            current_time = proc.arrival_time
+        # Any gap before the start is CPU idle time
+        if execution_start > current_time:
+            gantt_chart.append(("Idle", current_time, execution_start))
 
-        # Assign start time
-        proc.start_time = current_time
-
-        # Execute the process
-        execution_start = current_time
-        current_time += proc.burst_time
+        # Assign start time and execute the process
+        proc.start_time = execution_start
+        current_time = execution_start + proc.burst_time
         proc.completion_time = current_time
 
         # Add to Gantt chart
@@ -61,17 +87,18 @@ def fcfs(processes):
     avg_turnaround_time = total_turnaround_time / len(completed_processes)
 
     # Sort completed processes by ID for consistent output
-    completed_processes.sort(key=lambda p: p.p_id)
+    completed_processes.sort(key=operator.attrgetter('p_id'))
 
     return gantt_chart, avg_waiting_time, avg_turnaround_time, completed_processes
 
 
-def sjf(processes):
+def sjf(processes, presorted=False):
     """
     Shortest Job First (SJF) Scheduling Algorithm (Non-Preemptive).
 
     Args:
         processes (list): A list of Process objects.
+        presorted (bool): True if processes are already sorted by arrival time. Defaults to False.
 
     Returns:
         tuple: Contains:
@@ -80,59 +107,53 @@ def sjf(processes):
             - float: Average turnaround time.
             - list: List of completed Process objects with calculated metrics.
     """
-    process_list = sorted(copy.deepcopy(processes), key=lambda p: p.arrival_time)
+    process_list = _prepare(processes, presorted)
     completed_processes = []
     gantt_chart = []
     current_time = 0
     total_waiting_time = 0
     total_turnaround_time = 0
     n = len(process_list)
-    remaining_processes = list(process_list) # Keep track of processes not yet completed
 
-    while len(completed_processes) < n:
-        # Find processes that have arrived and are ready
-        ready_queue = [p for p in remaining_processes if p.arrival_time <= current_time]
+    # Min-heap of arrived processes keyed on (burst_time, arrival index).
+    # The arrival index keeps ties in arrival order and avoids comparing Process objects.
+    ready_heap = []
+    next_idx = 0 # Index of the next process to arrive in process_list
 
-        if not ready_queue:
-            # If no process is ready, find the next arrival time
-            next_arrival_time = min(p.arrival_time for p in remaining_processes)
-            if current_time < next_arrival_time:
-                 gantt_chart.append(("Idle", current_time, next_arrival_time))
-                 current_time = next_arrival_time
-            # Re-check ready queue after advancing time
-            ready_queue = [p for p in remaining_processes if p.arrival_time <= current_time]
-
-
-        if ready_queue:
-             # Select the process with the shortest burst time from the ready queue
-            ready_queue.sort(key=lambda p: p.burst_time)
-            proc = ready_queue[0]
-
-            # Remove selected process from remaining list
-            remaining_processes.remove(proc)
-
-            # Assign start time if not already set (first time it runs)
-            if proc.start_time == -1:
-                 proc.start_time = current_time
-
-            # Execute the process
-            execution_start = current_time
-            current_time += proc.burst_time
-            proc.completion_time = current_time
+    while len(completed_processes) < n:
+        # Push every process that has arrived by now onto the heap
+        while next_idx < n and process_list[next_idx].arrival_time <= current_time:
+            heapq.heappush(ready_heap, (process_list[next_idx].burst_time, next_idx, process_list[next_idx]))
+            next_idx += 1
+
+        if not ready_heap:
+            # If no process is ready, jump ahead to the next arrival time
+            next_arrival_time = process_list[next_idx].arrival_time
+            gantt_chart.append(("Idle", current_time, next_arrival_time))
+            current_time = next_arrival_time
+            continue
+
+        # Pop the process with the shortest burst time
+        _, _, proc = heapq.heappop(ready_heap)
+
+        # Assign start time if not already set (first time it runs)
+        if proc.start_time == -1:
+            proc.start_time = current_time
 
-            # Add to Gantt chart
-            gantt_chart.append((proc.p_id, execution_start, proc.completion_time))
+        # Execute the process
+        execution_start = current_time
+        current_time += proc.burst_time
+        proc.completion_time = current_time
 
-            # Calculate metrics
-            proc.calculate_metrics()
-            total_waiting_time += proc.waiting_time
-            total_turnaround_time += proc.turnaround_time
+        # Add to Gantt chart
+        gantt_chart.append((proc.p_id, execution_start, proc.completion_time))
 
-            completed_processes.append(proc)
-        elif not remaining_processes:
-             # Should not happen if logic is correct, but break just in case
-             break
+        # Calculate metrics
+        proc.calculate_metrics()
+        total_waiting_time += proc.waiting_time
+        total_turnaround_time += proc.turnaround_time
 
+        completed_processes.append(proc)
 
     if not completed_processes:
         return [], 0.0, 0.0, []
@@ -141,18 +162,25 @@ def sjf(processes):
     avg_turnaround_time = total_turnaround_time / len(completed_processes)
 
     # Sort completed processes by ID for consistent output
-    completed_processes.sort(key=lambda p: p.p_id)
+    completed_processes.sort(key=operator.attrgetter('p_id'))
 
     return gantt_chart, avg_waiting_time, avg_turnaround_time, completed_processes
 
 
-def priority_scheduling(processes):
+def priority_scheduling(processes, aging_rate=0, presorted=False):
     """
     Priority Scheduling Algorithm (Non-Preemptive).
     Lower priority number means higher priority.
 
+    With aging enabled, a waiting process's effective priority at time t is
+    priority - aging_rate * (t - arrival_time). The shared aging_rate * t term
+    does not change the relative order of ready processes, so each process is
+    keyed once on priority + aging_rate * arrival_time when it arrives.
+
     Args:
         processes (list): A list of Process objects.
+        aging_rate (float): Priority boost per time unit spent waiting. Defaults to 0 (no aging).
+        presorted (bool): True if processes are already sorted by arrival time. Defaults to False.
 
     Returns:
         tuple: Contains:
@@ -161,57 +189,65 @@ def priority_scheduling(processes):
             - float: Average turnaround time.
             - list: List of completed Process objects with calculated metrics.
     """
-    process_list = sorted(copy.deepcopy(processes), key=lambda p: p.arrival_time)
+    if aging_rate < 0:
+        raise ValueError("Aging rate must be non-negative.")
+
+    process_list = _prepare(processes, presorted)
     completed_processes = []
     gantt_chart = []
     current_time = 0
     total_waiting_time = 0
     total_turnaround_time = 0
     n = len(process_list)
-    remaining_processes = list(process_list)
+
+    # Min-heap of arrived processes keyed on (aged priority, arrival index).
+    # With integer priorities and no aging, that pair packs into the single int
+    # priority * n + index, so heap entries are plain ints compared in one step
+    # rather than tuples allocated per push.
+    ready_heap = []
+    packed_keys = aging_rate == 0 and all(isinstance(p.priority, int) for p in process_list)
+    next_idx = 0 # Index of the next process to arrive in process_list
 
     while len(completed_processes) < n:
-        # Find processes that have arrived
-        ready_queue = [p for p in remaining_processes if p.arrival_time <= current_time]
+        # Push every process that has arrived by now onto the heap
+        while next_idx < n and process_list[next_idx].arrival_time <= current_time:
+            proc = process_list[next_idx]
+            if packed_keys:
+                heapq.heappush(ready_heap, proc.priority * n + next_idx)
+            else:
+                key = proc.priority + aging_rate * proc.arrival_time
+                heapq.heappush(ready_heap, (key, next_idx, proc))
+            next_idx += 1
 
-        if not ready_queue:
-            # If no process is ready, find the next arrival time
-            next_arrival_time = min(p.arrival_time for p in remaining_processes)
-            if current_time < next_arrival_time:
-                 gantt_chart.append(("Idle", current_time, next_arrival_time))
-                 current_time = next_arrival_time
-            # Re-check ready queue
-            ready_queue = [p for p in remaining_processes if p.arrival_time <= current_time]
-
-        if ready_queue:
-            # Select the process with the highest priority (lowest priority number)
-            ready_queue.sort(key=lambda p: p.priority)
-            proc = ready_queue[0]
-
-            # Remove selected process from remaining list
-            remaining_processes.remove(proc)
-
-            # Assign start time
-            if proc.start_time == -1:
-                proc.start_time = current_time
-
-            # Execute the process
-            execution_start = current_time
-            current_time += proc.burst_time
-            proc.completion_time = current_time
+        if not ready_heap:
+            # If no process is ready, jump ahead to the next arrival time
+            next_arrival_time = process_list[next_idx].arrival_time
+            gantt_chart.append(("Idle", current_time, next_arrival_time))
+            current_time = next_arrival_time
+            continue
 
-            # Add to Gantt chart
-            gantt_chart.append((proc.p_id, execution_start, proc.completion_time))
+        # Pop the process with the highest priority (lowest key)
+        entry = heapq.heappop(ready_heap)
+        proc = process_list[entry % n] if packed_keys else entry[2]
 
-            # Calculate metrics
-            proc.calculate_metrics()
-            total_waiting_time += proc.waiting_time
-            total_turnaround_time += proc.turnaround_time
+        # Assign start time
+        if proc.start_time == -1:
+            proc.start_time = current_time
 
-            completed_processes.append(proc)
-        elif not remaining_processes:
-             break
+        # Execute the process
+        execution_start = current_time
+        current_time += proc.burst_time
+        proc.completion_time = current_time
 
+        # Add to Gantt chart
+        gantt_chart.append((proc.p_id, execution_start, proc.completion_time))
+
+        # Calculate metrics
+        proc.calculate_metrics()
+        total_waiting_time += proc.waiting_time
+        total_turnaround_time += proc.turnaround_time
+
+        completed_processes.append(proc)
 
     if not completed_processes:
         return [], 0.0, 0.0, []
@@ -220,18 +256,19 @@ def priority_scheduling(processes):
     avg_turnaround_time = total_turnaround_time / len(completed_processes)
 
     # Sort completed processes by ID for consistent output
-    completed_processes.sort(key=lambda p: p.p_id)
+    completed_processes.sort(key=operator.attrgetter('p_id'))
 
     return gantt_chart, avg_waiting_time, avg_turnaround_time, completed_processes
 
 
-def round_robin(processes, time_quantum):
+def round_robin(processes, time_quantum, presorted=False):
     """
     Round Robin (RR) Scheduling Algorithm.
 
     Args:
         processes (list): A list of Process objects.
         time_quantum (int): The time slice allocated to each process.
+        presorted (bool): True if processes are already sorted by arrival time. Defaults to False.
 
     Returns:
         tuple: Contains:
@@ -243,7 +280,7 @@ def round_robin(processes, time_quantum):
     if time_quantum <= 0:
         raise ValueError("Time quantum must be positive.")
 
-    process_list = sorted(copy.deepcopy(processes), key=lambda p: p.arrival_time)
+    process_list = _prepare(processes, presorted)
     completed_processes_dict = {} # Use dict for easy lookup by p_id
     gantt_chart = []
     current_time = 0
@@ -252,15 +289,21 @@ def round_robin(processes, time_quantum):
     n = len(process_list)
 
     ready_queue = deque()
+    # Bind the hot-loop deque methods once instead of looking them up every slice
+    enqueue = ready_queue.append
+    dequeue = ready_queue.popleft
     process_idx = 0 # To track next process to check for arrival
 
-    last_gantt_entry = None # To merge consecutive runs of the same process
+    # Gantt entry currently being extended; consecutive runs of the same process
+    # (or Idle) are merged here and only appended once a different entry starts
+    cur_pid, cur_start, cur_end = None, 0, 0
 
     while len(completed_processes_dict) < n:
         # Add newly arrived processes to the ready queue
         while process_idx < n and process_list[process_idx].arrival_time <= current_time:
-            process_list[process_idx].remaining_burst_time = process_list[process_idx].burst_time # Initialize remaining time
-            ready_queue.append(process_list[process_idx])
+            arriving = process_list[process_idx]
+            arriving.remaining_burst_time = arriving.burst_time # Initialize remaining time
+            enqueue(arriving)
             process_idx += 1
 
         if not ready_queue:
@@ -268,22 +311,21 @@ def round_robin(processes, time_quantum):
             if process_idx < n:
                 next_arrival_time = process_list[process_idx].arrival_time
                 if current_time < next_arrival_time:
-                     # Add Idle time to Gantt chart only if it's different from last entry
-                     if last_gantt_entry is None or last_gantt_entry[0] != "Idle":
-                         gantt_chart.append(("Idle", current_time, next_arrival_time))
-                         last_gantt_entry = ("Idle", current_time, next_arrival_time)
-                     elif last_gantt_entry[0] == "Idle": # Extend previous idle block
-                         gantt_chart[-1] = ("Idle", last_gantt_entry[1], next_arrival_time)
-                         last_gantt_entry = gantt_chart[-1]
-
-                     current_time = next_arrival_time
+                    if cur_pid == "Idle": # Extend the current idle block
+                        cur_end = next_arrival_time
+                    else:
+                        if cur_pid is not None:
+                            gantt_chart.append((cur_pid, cur_start, cur_end))
+                        cur_pid, cur_start, cur_end = "Idle", current_time, next_arrival_time
+
+                    current_time = next_arrival_time
                 continue # Go back to check for arrivals at the new current_time
             else:
                 # No processes left to arrive and queue is empty, simulation ends
                 break
 
         # Get process from front of the ready queue
-        proc = ready_queue.popleft()
+        proc = dequeue()
 
         # Record start time if it's the first time the process runs
         if proc.start_time == -1:
@@ -297,19 +339,34 @@ def round_robin(processes, time_quantum):
         current_time += time_slice
 
         # Add to Gantt chart
-        # Merge with the previous entry if it's the same process
-        if last_gantt_entry and last_gantt_entry[0] == proc.p_id and last_gantt_entry[2] == execution_start:
-             gantt_chart[-1] = (proc.p_id, last_gantt_entry[1], current_time)
+        # Extend the current entry if it's the same process, otherwise flush it and start a new one
+        if cur_pid == proc.p_id and cur_end == execution_start:
+            cur_end = current_time
         else:
-             gantt_chart.append((proc.p_id, execution_start, current_time))
-        last_gantt_entry = gantt_chart[-1]
-
+            if cur_pid is not None:
+                gantt_chart.append((cur_pid, cur_start, cur_end))
+            cur_pid, cur_start, cur_end = proc.p_id, execution_start, current_time
+
+        # Fast path: with nobody else waiting and no arrival yet, the process would be
+        # dequeued again slice after slice. Run that whole stretch at once, up to the
+        # end of the slice in which the next process arrives (or to completion).
+        if (proc.remaining_burst_time > 0 and not ready_queue
+                and (process_idx >= n or process_list[process_idx].arrival_time > current_time)):
+            if process_idx < n:
+                gap = process_list[process_idx].arrival_time - current_time
+                run_time = min(-(-gap // time_quantum) * time_quantum, proc.remaining_burst_time)
+            else:
+                run_time = proc.remaining_burst_time
+            proc.remaining_burst_time -= run_time
+            current_time += run_time
+            cur_end = current_time
 
         # Add any processes that arrived *during* this time slice execution
         while process_idx < n and process_list[process_idx].arrival_time <= current_time:
-             process_list[process_idx].remaining_burst_time = process_list[process_idx].burst_time
-             ready_queue.append(process_list[process_idx])
-             process_idx += 1
+            arriving = process_list[process_idx]
+            arriving.remaining_burst_time = arriving.burst_time
+            enqueue(arriving)
+            process_idx += 1
 
 
         if proc.remaining_burst_time == 0:
@@ -321,8 +378,11 @@ def round_robin(processes, time_quantum):
             completed_processes_dict[proc.p_id] = proc # Store completed process
         else:
             # Process not finished, add back to the end of the ready queue
-            ready_queue.append(proc)
+            enqueue(proc)
 
+    # Flush the last Gantt entry
+    if cur_pid is not None:
+        gantt_chart.append((cur_pid, cur_start, cur_end))
 
     if not completed_processes_dict:
         return [], 0.0, 0.0, []
@@ -331,7 +391,341 @@ def round_robin(processes, time_quantum):
     avg_turnaround_time = total_turnaround_time / n
 
     # Convert completed processes dict back to a list sorted by ID
-    completed_processes_list = sorted(list(completed_processes_dict.values()), key=lambda p: p.p_id)
+    completed_processes_list = sorted(completed_processes_dict.values(), key=operator.attrgetter('p_id'))
 
     return gantt_chart, avg_waiting_time, avg_turnaround_time, completed_processes_list
 
+
+def srpt(processes, presorted=False):
+    """
+    Shortest Remaining Processing Time (SRPT) Scheduling Algorithm (Preemptive SJF).
+
+    The running process is preempted whenever a newly arrived process needs
+    less CPU time than it has left. Decisions are only made at arrivals and
+    completions, so each process is pushed to the ready queue at most once
+    per scheduling event instead of once per time unit.
+
+    Args:
+        processes (list): A list of Process objects.
+        presorted (bool): True if processes are already sorted by arrival time. Defaults to False.
+
+    Returns:
+        tuple: Contains:
+            - list: Gantt chart entries [(p_id, start, end), ...].
+            - float: Average waiting time.
+            - float: Average turnaround time.
+            - list: List of completed Process objects with calculated metrics.
+    """
+    process_list = _prepare(processes, presorted)
+    completed_processes = []
+    gantt_chart = []
+    current_time = 0
+    total_waiting_time = 0
+    total_turnaround_time = 0
+    n = len(process_list)
+
+    # Min-heap keyed on (remaining_burst_time, arrival index). The running process
+    # is popped while it runs and pushed back with its new remaining time, so the
+    # queue never holds stale keys.
+    ready_queue = []
+    next_idx = 0 # Index of the next process to arrive in process_list
+
+    # Gantt entry currently being extended, so a process that keeps the CPU
+    # across an arrival is shown as one block
+    cur_pid, cur_start, cur_end = None, 0, 0
+
+    while len(completed_processes) < n:
+        # Add every process that has arrived by now to the ready queue
+        while next_idx < n and process_list[next_idx].arrival_time <= current_time:
+            proc = process_list[next_idx]
+            heapq.heappush(ready_queue, (proc.remaining_burst_time, next_idx, proc))
+            next_idx += 1
+
+        if not ready_queue:
+            # If no process is ready, jump ahead to the next arrival time
+            next_arrival_time = process_list[next_idx].arrival_time
+            if cur_pid is not None:
+                gantt_chart.append((cur_pid, cur_start, cur_end))
+            cur_pid, cur_start, cur_end = "Idle", current_time, next_arrival_time
+            current_time = next_arrival_time
+            continue
+
+        # Take the process with the least remaining time
+        _, idx, proc = heapq.heappop(ready_queue)
+
+        # Record start time if it's the first time the process runs
+        if proc.start_time == -1:
+            proc.start_time = current_time
+
+        # Run until the process finishes or the next arrival forces a new decision
+        execution_start = current_time
+        run_time = proc.remaining_burst_time
+        if next_idx < n:
+            run_time = min(run_time, process_list[next_idx].arrival_time - current_time)
+        proc.remaining_burst_time -= run_time
+        current_time += run_time
+
+        # Add to Gantt chart, extending the current entry if the same process continues
+        if cur_pid == proc.p_id and cur_end == execution_start:
+            cur_end = current_time
+        else:
+            if cur_pid is not None:
+                gantt_chart.append((cur_pid, cur_start, cur_end))
+            cur_pid, cur_start, cur_end = proc.p_id, execution_start, current_time
+
+        if proc.remaining_burst_time == 0:
+            # Process completed
+            proc.completion_time = current_time
+            proc.calculate_metrics()
+            total_waiting_time += proc.waiting_time
+            total_turnaround_time += proc.turnaround_time
+            completed_processes.append(proc)
+        else:
+            # Preempted (or about to be re-checked against new arrivals)
+            heapq.heappush(ready_queue, (proc.remaining_burst_time, idx, proc))
+
+    # Flush the last Gantt entry
+    if cur_pid is not None:
+        gantt_chart.append((cur_pid, cur_start, cur_end))
+
+    if not completed_processes:
+        return [], 0.0, 0.0, []
+
+    avg_waiting_time = total_waiting_time / len(completed_processes)
+    avg_turnaround_time = total_turnaround_time / len(completed_processes)
+
+    # Sort completed processes by ID for consistent output
+    completed_processes.sort(key=operator.attrgetter('p_id'))
+
+    return gantt_chart, avg_waiting_time, avg_turnaround_time, completed_processes
+
+
+def hrrn(processes, presorted=False):
+    """
+    Highest Response Ratio Next (HRRN) Scheduling Algorithm (Non-Preemptive).
+
+    Picks the ready process with the highest response ratio
+    (waiting time + burst time) / burst time. Like SJF it favours short jobs,
+    but a long job's ratio keeps growing while it waits, so it cannot starve.
+    The ratios depend on the current time, so they are computed only for the
+    ready processes at each scheduling decision.
+
+    A heap is deliberately not used: each waiting process's ratio grows at
+    its own rate (1 / burst time per time unit), so the ratios cross over as
+    time passes and no key fixed at push time stays valid. Rescanning the
+    ready list costs O(n) per decision, O(n^2) in the worst case.
+
+    Args:
+        processes (list): A list of Process objects.
+        presorted (bool): True if processes are already sorted by arrival time. Defaults to False.
+
+    Returns:
+        tuple: Contains:
+            - list: Gantt chart entries [(p_id, start, end), ...].
+            - float: Average waiting time.
+            - float: Average turnaround time.
+            - list: List of completed Process objects with calculated metrics.
+    """
+    process_list = _prepare(processes, presorted)
+    completed_processes = []
+    gantt_chart = []
+    current_time = 0
+    total_waiting_time = 0
+    total_turnaround_time = 0
+    n = len(process_list)
+
+    ready_queue = [] # Arrived processes as (arrival index, process); order is irrelevant
+    next_idx = 0 # Index of the next process to arrive in process_list
+
+    while len(completed_processes) < n:
+        # Add every process that has arrived by now to the ready queue
+        while next_idx < n and process_list[next_idx].arrival_time <= current_time:
+            ready_queue.append((next_idx, process_list[next_idx]))
+            next_idx += 1
+
+        if not ready_queue:
+            # If no process is ready, jump ahead to the next arrival time
+            next_arrival_time = process_list[next_idx].arrival_time
+            gantt_chart.append(("Idle", current_time, next_arrival_time))
+            current_time = next_arrival_time
+            continue
+
+        # Select the highest response ratio; ties go to the earliest arrival
+        best = 0
+        best_ratio = -1
+        for i, (idx, p) in enumerate(ready_queue):
+            waited = current_time - p.arrival_time
+            ratio = (waited + p.burst_time) / p.burst_time if p.burst_time > 0 else float('inf')
+            if ratio > best_ratio or (ratio == best_ratio and idx < ready_queue[best][0]):
+                best, best_ratio = i, ratio
+        _, proc = ready_queue[best]
+        # Remove by swapping with the last entry, O(1)
+        ready_queue[best] = ready_queue[-1]
+        ready_queue.pop()
+
+        # Assign start time
+        proc.start_time = current_time
+
+        # Execute the process
+        execution_start = current_time
+        current_time += proc.burst_time
+        proc.completion_time = current_time
+
+        # Add to Gantt chart
+        gantt_chart.append((proc.p_id, execution_start, proc.completion_time))
+
+        # Calculate metrics
+        proc.calculate_metrics()
+        total_waiting_time += proc.waiting_time
+        total_turnaround_time += proc.turnaround_time
+
+        completed_processes.append(proc)
+
+    if not completed_processes:
+        return [], 0.0, 0.0, []
+
+    avg_waiting_time = total_waiting_time / len(completed_processes)
+    avg_turnaround_time = total_turnaround_time / len(completed_processes)
+
+    # Sort completed processes by ID for consistent output
+    completed_processes.sort(key=operator.attrgetter('p_id'))
+
+    return gantt_chart, avg_waiting_time, avg_turnaround_time, completed_processes
+
+
+# Algorithm names understood by run_algorithm()
+ALGORITHM_NAMES = ('fcfs', 'sjf', 'srpt', 'hrrn', 'priority', 'rr')
+
+
+def run_algorithm(algorithm_name, processes, time_quantum=None, presorted=False, aging_rate=0):
+    """
+    Runs a scheduling algorithm selected by name.
+
+    Args:
+        algorithm_name (str): One of 'fcfs', 'sjf', 'srpt', 'hrrn', 'priority' or 'rr'.
+        processes (list): A list of Process objects.
+        time_quantum (int): The time slice for Round Robin (required for 'rr'), ignored otherwise.
+        presorted (bool): True if processes are already sorted by arrival time. Defaults to False.
+        aging_rate (float): Priority aging rate for 'priority', ignored otherwise. Defaults to 0.
+
+    Returns:
+        tuple: The selected algorithm's (gantt_chart, avg_waiting_time,
+            avg_turnaround_time, completed_processes) result.
+    """
+    if algorithm_name == 'fcfs':
+        return fcfs(processes, presorted=presorted)
+    elif algorithm_name == 'sjf':
+        return sjf(processes, presorted=presorted)
+    elif algorithm_name == 'srpt':
+        return srpt(processes, presorted=presorted)
+    elif algorithm_name == 'hrrn':
+        return hrrn(processes, presorted=presorted)
+    elif algorithm_name == 'priority':
+        return priority_scheduling(processes, aging_rate=aging_rate, presorted=presorted)
+    elif algorithm_name == 'rr':
+        if time_quantum is None:
+            raise ValueError("Round Robin requires a time quantum.")
+        return round_robin(processes, time_quantum, presorted=presorted)
+    raise ValueError(f"Unknown algorithm: {algorithm_name}")
+
+
+def compare_algorithms(processes, algorithm_names=None, time_quantum=None, aging_rate=0):
+    """
+    Runs several scheduling algorithms on the same workload.
+
+    The workload is sorted by arrival time once and every algorithm is run on
+    it with presorted=True, so only the per-run working copies are repeated.
+
+    Args:
+        processes (list): A list of Process objects.
+        algorithm_names (list): Names accepted by run_algorithm(). Defaults to
+            every algorithm, leaving out 'rr' when no time_quantum is given.
+        time_quantum (int): The time slice for Round Robin.
+        aging_rate (float): Priority aging rate for 'priority', ignored otherwise. Defaults to 0.
+
+    Returns:
+        dict: Maps each algorithm name to its run_algorithm() result.
+    """
+    if algorithm_names is None:
+        algorithm_names = [name for name in ALGORITHM_NAMES if name != 'rr' or time_quantum is not None]
+
+    ordered = sorted(processes, key=lambda p: p.arrival_time)
+    return {name: run_algorithm(name, ordered, time_quantum, presorted=True, aging_rate=aging_rate)
+            for name in algorithm_names}
+
+
+def schedule_batch(workloads, algorithm_name, time_quantum=None, max_workers=None, aging_rate=0):
+    """
+    Runs one scheduling algorithm over many independent workloads in parallel.
+
+    Each simulation is sequential, but separate workloads (e.g. randomized
+    arrival sets in a Monte-Carlo study) share nothing, so they are spread
+    across worker processes and scale with the number of CPU cores.
+
+    Args:
+        workloads (list): A list of workloads, each a list of Process objects.
+        algorithm_name (str): One of 'fcfs', 'sjf', 'srpt', 'hrrn', 'priority' or 'rr'.
+        time_quantum (int): The time slice for Round Robin, ignored otherwise.
+        max_workers (int): Number of worker processes. Defaults to the number of CPUs.
+            With a single worker or a single workload the batch runs in-process.
+        aging_rate (float): Priority aging rate for 'priority', ignored otherwise. Defaults to 0.
+
+    Returns:
+        list: One run_algorithm() result per workload, in input order.
+    """
+    workloads = list(workloads)
+    workers = max_workers or os.cpu_count() or 1
+    run = functools.partial(run_algorithm, algorithm_name, time_quantum=time_quantum, aging_rate=aging_rate)
+
+    # A pool only adds process start-up and pickling cost when it cannot run anything in parallel
+    if workers == 1 or len(workloads) <= 1:
+        return [run(workload) for workload in workloads]
+
+    # Send workloads in chunks so each round trip to a worker carries several simulations
+    chunksize = max(1, len(workloads) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, workloads, chunksize=chunksize))
+
+
+@functools.lru_cache(maxsize=256)
+def _simulate_workload(algorithm_name, workload, time_quantum, presorted, aging_rate):
+    """Runs and caches one simulation of a workload fingerprint (see simulate)."""
+    processes = [Process(*fields) for fields in workload]
+    gantt_chart, avg_waiting_time, avg_turnaround_time, completed_processes = run_algorithm(
+        algorithm_name, processes, time_quantum, presorted, aging_rate)
+    results = tuple(
+        ProcessResult(p.p_id, p.arrival_time, p.burst_time, p.priority,
+                      p.start_time, p.completion_time, p.waiting_time, p.turnaround_time)
+        for p in completed_processes
+    )
+    return tuple(gantt_chart), avg_waiting_time, avg_turnaround_time, results
+
+
+def simulate(algorithm_name, processes, time_quantum=None, presorted=False, aging_rate=0):
+    """
+    Memoized version of run_algorithm() returning immutable results.
+
+    Results are cached on a fingerprint of the workload, so repeating a
+    simulation with the same processes, algorithm and parameters (e.g. when
+    switching back and forth between algorithms) returns immediately.
+
+    Args:
+        algorithm_name (str): One of 'fcfs', 'sjf', 'srpt', 'hrrn', 'priority' or 'rr'.
+        processes (list): A list of Process objects.
+        time_quantum (int): The time slice for Round Robin, ignored otherwise.
+        presorted (bool): True if processes are already sorted by arrival time. Defaults to False.
+        aging_rate (float): Priority aging rate for 'priority', ignored otherwise. Defaults to 0.
+
+    Returns:
+        tuple: Contains:
+            - tuple: Gantt chart entries ((p_id, start, end), ...).
+            - float: Average waiting time.
+            - float: Average turnaround time.
+            - tuple: ProcessResult entries sorted by p_id.
+    """
+    workload = tuple((p.p_id, p.arrival_time, p.burst_time, p.priority) for p in processes)
+    if algorithm_name != 'rr':
+        time_quantum = None # Only Round Robin uses it; keep the cache key canonical
+    if algorithm_name != 'priority':
+        aging_rate = 0 # Likewise only used by priority scheduling
+    return _simulate_workload(algorithm_name, workload, time_quantum, presorted, aging_rate)
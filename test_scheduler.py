@@ -0,0 +1,220 @@
+# test_scheduler.py
+# Checks the scheduler entry points against straightforward reference runs.
+
+import random
+import unittest
+from fractions import Fraction
+
+import scheduler
+from process import Process
+
+
+def random_workloads(seed, count=300, max_n=20):
+    """Yields lists of (p_id, arrival_time, burst_time, priority) tuples."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(0, max_n)
+        yield [(i, rng.randint(0, 3 * n + 5), rng.randint(1, 12), rng.randint(0, 4)) for i in range(1, n + 1)]
+
+
+def summarize(result):
+    """Reduces a scheduler result to plain values that compare by equality."""
+    gantt_chart, avg_waiting, avg_turnaround, completed = result
+    return (list(gantt_chart), avg_waiting, avg_turnaround,
+            [(p.p_id, p.start_time, p.completion_time, p.waiting_time, p.turnaround_time) for p in completed])
+
+
+def reference_srpt(workload):
+    """1-tick SRPT: each time unit runs the ready process with least remaining time."""
+    order = {p_id: idx for idx, (p_id, *_) in enumerate(sorted(workload, key=lambda w: w[1]))}
+    remaining = {p_id: burst for p_id, _, burst, _ in workload}
+    start, completion = {}, {}
+    t = 0
+    while len(completion) < len(workload):
+        ready = [w for w in workload if w[1] <= t and w[0] not in completion]
+        if not ready:
+            t += 1
+            continue
+        p_id = min(ready, key=lambda w: (remaining[w[0]], order[w[0]]))[0]
+        start.setdefault(p_id, t)
+        remaining[p_id] -= 1
+        t += 1
+        if remaining[p_id] == 0:
+            completion[p_id] = t
+    return start, completion
+
+
+def reference_hrrn(workload):
+    """Brute-force HRRN: at each decision, rescan the ready set for the highest exact response ratio."""
+    order = {p_id: idx for idx, (p_id, *_) in enumerate(sorted(workload, key=lambda w: w[1]))}
+    start, completion = {}, {}
+    t = 0
+    while len(completion) < len(workload):
+        ready = [w for w in workload if w[1] <= t and w[0] not in completion]
+        if not ready:
+            t = min(w[1] for w in workload if w[0] not in completion)
+            continue
+        p_id, arrival, burst, _ = min(ready, key=lambda w: (-Fraction(t - w[1] + w[2], w[2]), order[w[0]]))
+        start[p_id] = t
+        t += burst
+        completion[p_id] = t
+    return start, completion
+
+
+def reference_aged_priority(workload, aging_rate):
+    """Brute-force aged priority: at each decision, rescan for the lowest priority - aging_rate * waited."""
+    order = {p_id: idx for idx, (p_id, *_) in enumerate(sorted(workload, key=lambda w: w[1]))}
+    start, completion = {}, {}
+    t = 0
+    while len(completion) < len(workload):
+        ready = [w for w in workload if w[1] <= t and w[0] not in completion]
+        if not ready:
+            t = min(w[1] for w in workload if w[0] not in completion)
+            continue
+        p_id, arrival, burst, _ = min(ready, key=lambda w: (w[3] - aging_rate * (t - w[1]), order[w[0]]))
+        start[p_id] = t
+        t += burst
+        completion[p_id] = t
+    return start, completion
+
+
+def reference_round_robin(workload, time_quantum):
+    """Slice-by-slice Round Robin; arrivals during a slice queue ahead of the preempted process."""
+    pending = sorted(workload, key=lambda w: w[1])
+    remaining = {p_id: burst for p_id, _, burst, _ in workload}
+    start, completion = {}, {}
+    queue = []
+    t = 0
+    idx = 0
+    while len(completion) < len(workload):
+        while idx < len(pending) and pending[idx][1] <= t:
+            queue.append(pending[idx][0])
+            idx += 1
+        if not queue:
+            t = pending[idx][1]
+            continue
+        p_id = queue.pop(0)
+        start.setdefault(p_id, t)
+        run = min(time_quantum, remaining[p_id])
+        remaining[p_id] -= run
+        t += run
+        while idx < len(pending) and pending[idx][1] <= t:
+            queue.append(pending[idx][0])
+            idx += 1
+        if remaining[p_id] == 0:
+            completion[p_id] = t
+        else:
+            queue.append(p_id)
+    return start, completion
+
+
+def run_times(result):
+    """Extracts ({p_id: start_time}, {p_id: completion_time}) from a scheduler result."""
+    completed = result[3]
+    return ({p.p_id: p.start_time for p in completed},
+            {p.p_id: p.completion_time for p in completed})
+
+
+class TestScheduleBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.workloads = [[Process(*w) for w in workload] for workload in random_workloads(seed=5, count=40)]
+
+    def expected(self, algorithm_name, time_quantum=None):
+        return [summarize(scheduler.run_algorithm(algorithm_name, workload, time_quantum))
+                for workload in self.workloads]
+
+    def test_pool_matches_serial_run_in_input_order(self):
+        for algorithm_name, time_quantum in (('sjf', None), ('priority', None), ('rr', 3)):
+            results = scheduler.schedule_batch(self.workloads, algorithm_name, time_quantum, max_workers=2)
+            self.assertEqual([summarize(r) for r in results], self.expected(algorithm_name, time_quantum))
+
+    def test_serial_fallback(self):
+        results = scheduler.schedule_batch(self.workloads, 'fcfs', max_workers=1)
+        self.assertEqual([summarize(r) for r in results], self.expected('fcfs'))
+        single = scheduler.schedule_batch(self.workloads[:1], 'rr', 2)
+        self.assertEqual([summarize(r) for r in single], self.expected('rr', 2)[:1])
+
+    def test_aging_rate_is_forwarded(self):
+        # Without aging P3 runs before P2 at t=10; with aging_rate=1 P2 has waited long enough to go first
+        workload = [Process(1, 0, 10, 1), Process(2, 1, 5, 5), Process(3, 8, 2, 2)]
+        aged = summarize(scheduler.priority_scheduling(workload, aging_rate=1))
+        self.assertNotEqual(aged, summarize(scheduler.priority_scheduling(workload)))
+        self.assertEqual(summarize(scheduler.run_algorithm('priority', workload, aging_rate=1)), aged)
+        self.assertEqual(summarize(scheduler.compare_algorithms(workload, ['priority'], aging_rate=1)['priority']), aged)
+        results = scheduler.schedule_batch([workload, workload], 'priority', max_workers=2, aging_rate=1)
+        self.assertEqual([summarize(r) for r in results], [aged, aged])
+
+    def test_round_robin_requires_time_quantum(self):
+        with self.assertRaisesRegex(ValueError, "Round Robin requires a time quantum."):
+            scheduler.run_algorithm('rr', self.workloads[0])
+        with self.assertRaises(ValueError):
+            scheduler.schedule_batch(self.workloads, 'rr', max_workers=2)
+
+
+class TestSimulateCache(unittest.TestCase):
+
+    def setUp(self):
+        scheduler._simulate_workload.cache_clear()
+        self.workload = [Process(1, 0, 5, 2), Process(2, 1, 3, 1), Process(3, 2, 8, 3)]
+
+    def test_time_quantum_is_ignored_outside_round_robin(self):
+        first = scheduler.simulate('fcfs', self.workload, 5)
+        self.assertIs(scheduler.simulate('fcfs', self.workload, 2), first)
+        self.assertEqual(scheduler._simulate_workload.cache_info().hits, 1)
+        scheduler.simulate('rr', self.workload, 5)
+        scheduler.simulate('rr', self.workload, 2)
+        self.assertEqual(scheduler._simulate_workload.cache_info().misses, 3)
+
+    def test_aging_rate_is_only_keyed_for_priority(self):
+        scheduler.simulate('priority', self.workload, aging_rate=0)
+        scheduler.simulate('priority', self.workload, aging_rate=1)
+        self.assertEqual(scheduler._simulate_workload.cache_info().misses, 2)
+        scheduler.simulate('sjf', self.workload, aging_rate=0)
+        scheduler.simulate('sjf', self.workload, aging_rate=1)
+        info = scheduler._simulate_workload.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 3))
+
+    def test_cached_results_are_immutable(self):
+        gantt_chart, _, _, results = scheduler.simulate('sjf', self.workload)
+        self.assertIsInstance(gantt_chart, tuple)
+        self.assertIsInstance(results, tuple)
+        self.assertIsInstance(results[0], scheduler.ProcessResult)
+        with self.assertRaises(AttributeError):
+            results[0].waiting_time = 0
+
+
+class TestSchedulersAgainstReference(unittest.TestCase):
+
+    def test_srpt_matches_tick_simulation(self):
+        for workload in random_workloads(seed=1):
+            result = scheduler.srpt([Process(*w) for w in workload])
+            self.assertEqual(run_times(result), reference_srpt(workload), workload)
+
+    def test_hrrn_matches_brute_force(self):
+        for workload in random_workloads(seed=2):
+            result = scheduler.hrrn([Process(*w) for w in workload])
+            self.assertEqual(run_times(result), reference_hrrn(workload), workload)
+
+    def test_aged_priority_matches_brute_force(self):
+        for workload in random_workloads(seed=6):
+            for aging_rate in (0.25, 0.5, 2):
+                result = scheduler.priority_scheduling([Process(*w) for w in workload], aging_rate=aging_rate)
+                self.assertEqual(run_times(result), reference_aged_priority(workload, aging_rate), workload)
+
+    def test_round_robin_matches_slice_simulation(self):
+        for workload in random_workloads(seed=3):
+            for time_quantum in (1, 2, 5):
+                result = scheduler.round_robin([Process(*w) for w in workload], time_quantum)
+                self.assertEqual(run_times(result), reference_round_robin(workload, time_quantum), workload)
+
+    def test_srpt_gantt_chart_is_contiguous_and_merged(self):
+        for workload in random_workloads(seed=4):
+            gantt_chart = scheduler.srpt([Process(*w) for w in workload])[0]
+            for previous, current in zip(gantt_chart, gantt_chart[1:]):
+                self.assertEqual(previous[2], current[1])
+                self.assertNotEqual(previous[0], current[0])
+
+
+if __name__ == "__main__":
+    unittest.main()